@@ -4,183 +4,553 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
-from datetime import datetime, timezone
+import codecs
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import BinaryIO
+import mmap
 import os
 import shutil
+import stat
+import time
 
+try:
+    from simdutf import validate_utf8 as _validate_utf8
+except ImportError:  # optional SIMD accelerator, fall back to the incremental decoder
+    _validate_utf8 = None
 
-class FileSystem:
+# number of bytes read at a time when scanning file contents
+_READ_CHUNK_SIZE = 65536
+
+# maximum number of paths remembered by the is_file and is_directory caches
+_PATH_CACHE_SIZE = 4096
+
+# number of threads used to scan subdirectories when listing files in parallel
+_PARALLEL_SCAN_WORKERS = 8
+
+# names of subdirectories skipped by default when listing files
+_DEFAULT_EXCLUDE_DIRECTORIES = frozenset({'__pycache__'})
+
+# os.fwalk and directory-relative stat are only available on POSIX platforms
+_HAS_FWALK = hasattr(os, 'fwalk')
+
+
+@lru_cache(maxsize=_PATH_CACHE_SIZE)
+def _is_file_cached(file_path: str) -> bool:
     """
-    File system operations
+    Cached os.path.isfile, used by is_file.
+
+    :param file_path: str, absolute path to the file, so that results for relative paths are not
+                      shared across working directories
+    :return: bool, True if the path corresponds to a file, False otherwise.
+    """
+
+    return os.path.isfile(file_path)
+
+
+@lru_cache(maxsize=_PATH_CACHE_SIZE)
+def _is_directory_cached(directory_path: str) -> bool:
+    """
+    Cached os.path.isdir, used by is_directory.
+
+    :param directory_path: str, absolute path to the directory, so that results for relative paths are not
+                           shared across working directories
+    :return: bool, True if the path corresponds to an existing directory, False otherwise.
+    """
+
+    return os.path.isdir(directory_path)
+
+
+def invalidate_cache() -> None:
     """
+    Clear the cached results of is_file and is_directory.
 
-    @staticmethod
-    def is_file(file_path: str) -> bool:
-        """
-        Determine if the given path corresponds to an existing file.
+    create_directory and remove_directory clear the cache automatically. Call this after
+    changing the file system by other means.
+    """
 
-        :param file_path: str, path to the file
-        :return: bool, True if the path corresponds to a file, False otherwise.
-                 If the object is found but does not correspond to a file, False is also returned.
-        """
+    _is_file_cached.cache_clear()
+    _is_directory_cached.cache_clear()
 
-        is_file_found = os.path.isfile(file_path)
-        return is_file_found
 
-    @staticmethod
-    def is_directory(directory_path: str) -> bool:
-        """
-        Determine if the given path corresponds to an existing directory.
+def is_file(file_path: str) -> bool:
+    """
+    Determine if the given path corresponds to an existing file.
 
-        :param directory_path: str, path to the directory
-        :return: bool, True if the path corresponds to an existing directory, False otherwise.
-                 If the object is found but does not correspond to a directory, False is also returned.
-        """
+    Results are cached per path, see invalidate_cache.
 
-        is_directory_found = os.path.isdir(directory_path)
-        return is_directory_found
+    :param file_path: str, path to the file
+    :return: bool, True if the path corresponds to a file, False otherwise.
+             If the object is found but does not correspond to a file, False is also returned.
+    """
 
-    @staticmethod
-    def is_object(path: str) -> bool:
-        """
-        Determine if the given path corresponds to an existing file system object.
+    is_file_found = _is_file_cached(os.path.abspath(file_path))
+    return is_file_found
 
-        :param path: str, path to a file system object, such as a file or directory
-        :return: bool, True if the path corresponds to an existing file system object, False otherwise.
-        """
 
-        is_present = os.path.exists(path)
-        return is_present
+def is_directory(directory_path: str) -> bool:
+    """
+    Determine if the given path corresponds to an existing directory.
 
-    @staticmethod
-    def get_file_size(file_path: str) -> int:
-        """
-        Determines the file size in bytes.
+    Results are cached per path, see invalidate_cache.
 
-        :param file_path: str, path to the file
-        :return: int, size of the file in bytes.
+    :param directory_path: str, path to the directory
+    :return: bool, True if the path corresponds to an existing directory, False otherwise.
+             If the object is found but does not correspond to a directory, False is also returned.
+    """
 
-        :raises FileNotFoundError: If the file is not found.
-        """
+    is_directory_found = _is_directory_cached(os.path.abspath(directory_path))
+    return is_directory_found
 
-        is_file_found = FileSystem.is_file(file_path)
-        if not is_file_found:
-            raise FileNotFoundError('file not found')
 
-        file_size = os.path.getsize(file_path)
+def is_object(path: str) -> bool:
+    """
+    Determine if the given path corresponds to an existing file system object.
 
-        return file_size
+    :param path: str, path to a file system object, such as a file or directory
+    :return: bool, True if the path corresponds to an existing file system object, False otherwise.
+    """
 
-    @staticmethod
-    def create_directory(directory_path: str) -> None:
-        """
-        Create a directory.
+    is_present = os.path.exists(path)
+    return is_present
 
-        :param directory_path: str, path to the directory
 
-        :raises FileExistsError: If the file system object already exists.
-        :raises OSError: If the directory could not be created.
-        """
+def _stat_regular_file(file_path: str) -> os.stat_result:
+    """
+    Stat a path that must correspond to an existing regular file.
+
+    Like os.path.isfile, any path that cannot be stat'ed counts as not found, for example a path
+    continuing below a file, a symbolic link loop, a name that is too long or a name containing a
+    null character.
+
+    :param file_path: str, path to the file
+    :return: os.stat_result, status of the file
+
+    :raises FileNotFoundError: If the file is not found.
+    """
+
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
+        raise FileNotFoundError('file not found')
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise FileNotFoundError('file not found')
 
-        is_present = FileSystem.is_object(directory_path)
-        if is_present:
-            raise FileExistsError('file system object already exists')
+    return file_stat
 
-        try:
-            os.makedirs(directory_path, exist_ok=False)
-        except OSError as exception_msg:
-            raise OSError(f"An error occurred while creating the directory: {exception_msg}")
 
-    @staticmethod
-    def remove_directory(directory_path: str) -> None:
-        """
-        Remove the directory and its contents.
+def get_file_size(file_path: str) -> int:
+    """
+    Determines the file size in bytes.
 
-        :param directory_path: str, path to the directory
+    :param file_path: str, path to the file
+    :return: int, size of the file in bytes.
 
-        :raises FileNotFoundError: If the directory does not exist or is not a directory.
-        :raises OSError: If the directory could not be removed.
-        """
+    :raises FileNotFoundError: If the file is not found.
+    """
 
-        is_dir = FileSystem.is_directory(directory_path)
-        if not is_dir:
+    file_stat = _stat_regular_file(file_path)
+
+    file_size = file_stat.st_size
+
+    return file_size
+
+
+def create_directory(directory_path: str) -> None:
+    """
+    Create a directory.
+
+    :param directory_path: str, path to the directory
+
+    :raises FileExistsError: If the file system object already exists.
+    :raises OSError: If the directory could not be created.
+    """
+
+    try:
+        os.makedirs(directory_path, exist_ok=False)
+    except FileExistsError:
+        raise FileExistsError('file system object already exists')
+    except OSError as exception_msg:
+        raise OSError(f"An error occurred while creating the directory: {exception_msg}")
+    finally:
+        invalidate_cache()
+
+
+def remove_directory(directory_path: str) -> None:
+    """
+    Remove the directory and its contents.
+
+    :param directory_path: str, path to the directory
+
+    :raises FileNotFoundError: If the directory does not exist or is not a directory.
+    :raises OSError: If the directory could not be removed.
+    """
+
+    try:
+        shutil.rmtree(directory_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError('path does not exist or is not a directory')
+    except OSError as exception_msg:
+        # e.g. rmtree refuses symbolic links, which only count as missing when they do not lead to a directory
+        if not os.path.isdir(directory_path):
             raise FileNotFoundError('path does not exist or is not a directory')
+        raise OSError(f"An error occurred while deleting the directory: {exception_msg}")
+    finally:
+        invalidate_cache()
+
+
+def get_file_timestamp(file_path: str) -> str:
+    """
+    Determines the timestamp when the file was last modified.
+
+    :param file_path: str, path to the file
+    :return: str, timestamp when the file was last modified in ISO 8601 format.
+
+    :raises FileNotFoundError: If the file is not found.
+    """
+
+    file_stat = _stat_regular_file(file_path)
+
+    last_modified_timestamp_seconds = int(file_stat.st_mtime)
+    utc_time = time.gmtime(last_modified_timestamp_seconds)
+    timestamp_iso = (f"{utc_time.tm_year:04d}-{utc_time.tm_mon:02d}-{utc_time.tm_mday:02d}"
+                     f"T{utc_time.tm_hour:02d}:{utc_time.tm_min:02d}:{utc_time.tm_sec:02d}+00:00")
+
+    return timestamp_iso
+
+
+def _is_utf8_stream(file: BinaryIO) -> bool:
+    """
+    Determine if the contents of an open binary file are UTF-8 encoded, decoding one chunk at a time.
+
+    :param file: BinaryIO, file opened in binary mode
+    :return: bool, True if the contents are UTF-8 encoded, otherwise False
+    """
+
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='strict')
+    try:
+        while chunk := file.read(_READ_CHUNK_SIZE):
+            # pure ASCII is valid UTF-8, unless a multi-byte sequence from the previous chunk is pending
+            if chunk.isascii() and not decoder.getstate()[0]:
+                continue
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+        is_utf8 = True
+    except UnicodeDecodeError:
+        is_utf8 = False
+
+    return is_utf8
+
 
-        try:
-            shutil.rmtree(directory_path)
-        except OSError as exception_msg:
-            raise OSError(f"An error occurred while deleting the directory: {exception_msg}")
+def _validate_utf8_mapped(file: BinaryIO) -> bool | None:
+    """
+    Validate the contents of an open binary file with the SIMD validator on a memory map of the file.
 
-    @staticmethod
-    def get_file_timestamp(file_path: str) -> str:
-        """
-        Determines the timestamp when the file was last modified.
+    :param file: BinaryIO, file opened in binary mode
+    :return: bool or None, True if the contents are UTF-8 encoded, False if not, and None if the file
+             cannot be memory-mapped, for example files reporting a size of 0 such as procfs entries,
+             or file systems without mmap support
+    """
 
-        :param file_path: str, path to the file
-        :return: str, timestamp when the file was last modified in ISO 8601 format.
+    try:
+        mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        is_utf8 = None
+    else:
+        with mapped_file:
+            is_utf8 = bool(_validate_utf8(mapped_file))
 
-        :raises FileNotFoundError: If the file is not found.
-        """
+    return is_utf8
 
-        is_file_found = FileSystem.is_file(file_path)
-        if not is_file_found:
-            raise FileNotFoundError('file not found')
 
-        last_modified_timestamp_seconds = int(os.stat(file_path).st_mtime)
-        timestamp_iso = datetime.fromtimestamp(last_modified_timestamp_seconds, timezone.utc).isoformat()
+def is_utf8_encoded(file_path: str) -> bool:
+    """
+    Determine if the file is UTF-8 encoded.
 
-        return timestamp_iso
+    :param file_path: str, path to the file
+    :return: bool, True if the file is UTF-8 encoded, otherwise False
 
-    @staticmethod
-    def is_utf8_encoded(file_path: str) -> bool:
-        """
-        Determine if the file is UTF-8 encoded.
+    :raises FileNotFoundError: If the file is not found.
+    """
 
-        :param file_path: str, path to the file
-        :return: bool, True if the file is UTF-8 encoded, otherwise False
+    _stat_regular_file(file_path)
 
-        :raises FileNotFoundError: If the file is not found.
-        """
+    with open(file_path, 'rb') as file:
+        is_utf8 = None
+        if _validate_utf8 is not None:
+            is_utf8 = _validate_utf8_mapped(file)
+        if is_utf8 is None:
+            is_utf8 = _is_utf8_stream(file)
 
-        is_file_found = FileSystem.is_file(file_path)
-        if not is_file_found:
-            raise FileNotFoundError('file not found')
+    return is_utf8
 
-        try:
-            with open(file_path, 'rb') as file:
-                raw_data = file.read()
-                raw_data.decode('utf-8')
-            is_utf8 = True
-        except UnicodeDecodeError:
-            is_utf8 = False
 
-        return is_utf8
+def _require_directory(directory_path: str) -> None:
+    """
+    Check that the path corresponds to an existing directory, bypassing the is_directory cache.
 
+    :param directory_path: str, path to the directory
 
-    @staticmethod
-    def list_files(directory_path: str, include_subdirectories: bool=False) -> list[str]:
-        """
-        List all filenames in a specified directory.
+    :raises FileNotFoundError: If the directory is not found.
+    """
+
+    if not os.path.isdir(directory_path):
+        raise FileNotFoundError(f"The directory {directory_path} does not exist.")
 
-        :param directory_path: str, path to the directory
-        :param include_subdirectories: bool, if True then lists all filenames from subdirectories, defaults to False
-        :return: list of str, list of filenames in the specified directory, relative to the directory
 
-        :raises FileNotFoundError: If the directory is not found.
-        """
+def _scan_directory(directory_path: str, prefix: str, extensions: tuple[str, ...] | None,
+                    exclude_directories: frozenset[str]) -> tuple[list[tuple[str, os.DirEntry]], list[tuple[str, str]]]:
+    """
+    Scan a single directory, separating its files from its subdirectories.
 
-        is_valid_directory = FileSystem.is_directory(directory_path)
-        if not is_valid_directory:
-            raise FileNotFoundError(f"The directory {directory_path} does not exist.")
+    Errors are only raised for the top-level directory, an unreadable subdirectory is reported as empty.
 
-        filename_list = []
+    :param directory_path: str, path to the directory
+    :param prefix: str, relative path of the directory with respect to the top-level directory,
+                   including the trailing separator
+    :param extensions: tuple of str or None, only files ending with one of these extensions are kept, None keeps all files
+    :param exclude_directories: frozenset of str, names of subdirectories to leave out
+    :return: (list of (str, os.DirEntry), list of (str, str)), the files as relative filename and directory entry,
+             and the subdirectories as relative prefix and path
+    """
+
+    file_list = []
+    subdirectory_list = []
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_directories:
+                        subdirectory_list.append((prefix + entry.name + os.sep, entry.path))
+                elif (extensions is None or entry.name.endswith(extensions)) and entry.is_file(follow_symlinks=False):
+                    file_list.append((prefix + entry.name, entry))
+    except OSError:
+        if not prefix:
+            raise
+        # like os.walk, subdirectories that cannot be read or were removed during the scan are skipped
+        file_list = []
+        subdirectory_list = []
+
+    return file_list, subdirectory_list
+
+
+def _scan_files(directory_path: str, include_subdirectories: bool, extensions: tuple[str, ...] | None,
+                exclude_directories: frozenset[str]) -> Iterator[list[tuple[str, os.DirEntry]]]:
+    """
+    Yield the files in a directory using a breadth-first scan, one list per scanned directory.
+
+    :param directory_path: str, path to the directory
+    :param include_subdirectories: bool, if True then also yields files from subdirectories
+    :param extensions: tuple of str or None, only files ending with one of these extensions are yielded, None yields all files
+    :param exclude_directories: frozenset of str, names of subdirectories that are not scanned
+    :return: iterator of list of (str, os.DirEntry), filename relative to the directory and its directory entry
+    """
+
+    pending_directories = deque([('', directory_path)])
+    while pending_directories:
+        prefix, current_directory = pending_directories.popleft()
+        file_list, subdirectory_list = _scan_directory(current_directory, prefix, extensions, exclude_directories)
         if include_subdirectories:
-            for root, _, files in os.walk(directory_path):
-                for file in files:
-                    full_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(full_path, directory_path)
-                    filename_list.append(relative_path)
-        else:
-            filename_list = [f for f in os.listdir(directory_path) if FileSystem.is_file(os.path.join(directory_path, f))]
-
-        return filename_list
+            pending_directories.extend(subdirectory_list)
+        yield file_list
+
+
+def _scan_files_parallel(directory_path: str, extensions: tuple[str, ...] | None,
+                         exclude_directories: frozenset[str]) -> Iterator[list[tuple[str, os.DirEntry]]]:
+    """
+    Yield the files in a directory and its subdirectories, one list per directory, scanning the
+    subdirectories concurrently.
+
+    The lists are yielded in the order their directories finish scanning.
+
+    :param directory_path: str, path to the directory
+    :param extensions: tuple of str or None, only files ending with one of these extensions are yielded, None yields all files
+    :param exclude_directories: frozenset of str, names of subdirectories that are not scanned
+    :return: iterator of list of (str, os.DirEntry), filename relative to the directory and its directory entry
+    """
+
+    executor = ThreadPoolExecutor(max_workers=_PARALLEL_SCAN_WORKERS)
+    try:
+        pending_scans = {executor.submit(_scan_directory, directory_path, '', extensions, exclude_directories)}
+        while pending_scans:
+            completed_scans, pending_scans = wait(pending_scans, return_when=FIRST_COMPLETED)
+            for completed_scan in completed_scans:
+                file_list, subdirectory_list = completed_scan.result()
+                for prefix, subdirectory_path in subdirectory_list:
+                    pending_scans.add(executor.submit(_scan_directory, subdirectory_path, prefix,
+                                                      extensions, exclude_directories))
+                yield file_list
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _scan_file_lists(directory_path: str, include_subdirectories: bool, parallel: bool,
+                     extensions: tuple[str, ...] | None,
+                     exclude_directories: frozenset[str]) -> Iterator[list[tuple[str, os.DirEntry]]]:
+    """
+    Check the directory and select the serial or the parallel scan.
+
+    :param directory_path: str, path to the directory
+    :param include_subdirectories: bool, if True then also yields files from subdirectories
+    :param parallel: bool, if True then subdirectories are scanned concurrently
+    :param extensions: tuple of str or None, only files ending with one of these extensions are yielded, None yields all files
+    :param exclude_directories: frozenset of str, names of subdirectories that are not scanned
+    :return: iterator of list of (str, os.DirEntry), filename relative to the directory and its directory entry
+
+    :raises FileNotFoundError: If the directory is not found.
+    """
+
+    _require_directory(directory_path)
+
+    if include_subdirectories and parallel:
+        file_list_iterator = _scan_files_parallel(directory_path, extensions, exclude_directories)
+    else:
+        file_list_iterator = _scan_files(directory_path, include_subdirectories, extensions, exclude_directories)
+
+    return file_list_iterator
+
+
+def _stat_files_fwalk(directory_path: str, extensions: tuple[str, ...] | None,
+                      exclude_directories: frozenset[str]) -> Iterator[tuple[str, os.stat_result]]:
+    """
+    Yield the status of the files in a directory and its subdirectories using os.fwalk.
+
+    Each file is stat'ed relative to the file descriptor of its directory, so only the last
+    path component is resolved. Only available on POSIX platforms. Errors are handled like the
+    scandir scan: they are raised for the top-level directory, while subdirectories that cannot
+    be opened are skipped.
+
+    :param directory_path: str, path to the directory
+    :param extensions: tuple of str or None, only files ending with one of these extensions are yielded, None yields all files
+    :param exclude_directories: frozenset of str, names of subdirectories that are not scanned
+    :return: iterator of (str, os.stat_result), filename relative to the directory and its status
+    """
+
+    # the trailing separator makes os.fwalk resolve a top-level directory given as a symbolic link
+    walk_root = os.path.join(directory_path, '')
+    # without onerror, os.fwalk skips subdirectories it cannot open and raises for the top-level directory
+    for root, subdirectory_names, filenames, directory_fd in os.fwalk(walk_root, onerror=None):
+        subdirectory_names[:] = [name for name in subdirectory_names if name not in exclude_directories]
+        relative_root = root[len(walk_root):]
+        prefix = relative_root + os.sep if relative_root else ''
+        for filename in filenames:
+            if extensions is not None and not filename.endswith(extensions):
+                continue
+            file_stat = os.stat(filename, dir_fd=directory_fd, follow_symlinks=False)
+            if stat.S_ISREG(file_stat.st_mode):
+                yield prefix + filename, file_stat
+
+
+def iter_files(directory_path: str, include_subdirectories: bool=False, parallel: bool=False,
+               extensions: tuple[str, ...] | None=None,
+               exclude_directories: frozenset[str]=_DEFAULT_EXCLUDE_DIRECTORIES) -> Iterator[str]:
+    """
+    Iterate over all filenames in a specified directory.
+
+    The directory is scanned lazily, one directory at a time, so the full listing is never held
+    in memory. Symbolic links are not followed: links to files are not listed and linked
+    directories are not descended into. Subdirectories that cannot be read, for example due to
+    permissions or because they are removed during the scan, are skipped like os.walk does.
+
+    :param directory_path: str, path to the directory
+    :param include_subdirectories: bool, if True then iterates over all filenames from subdirectories, defaults to False
+    :param parallel: bool, if True then subdirectories are scanned concurrently by a thread pool, which helps
+                     on high-latency file systems such as network mounts. The order of the filenames is not
+                     deterministic. Only used when include_subdirectories is True, defaults to False
+    :param extensions: tuple of str, only filenames ending with one of these extensions are produced,
+                       for example ('.tex', '.bib'). The comparison is case-sensitive, defaults to None for all files
+    :param exclude_directories: frozenset of str, names of subdirectories that are skipped entirely at any depth,
+                                defaults to frozenset({'__pycache__'})
+    :return: iterator of str, filenames in the specified directory, relative to the directory
+
+    :raises FileNotFoundError: If the directory is not found.
+    """
+
+    file_list_iterator = _scan_file_lists(directory_path, include_subdirectories, parallel, extensions,
+                                          exclude_directories)
+    filename_iterator = (filename for file_list in file_list_iterator for filename, _ in file_list)
+
+    return filename_iterator
+
+
+def list_files(directory_path: str, include_subdirectories: bool=False, parallel: bool=False,
+               extensions: tuple[str, ...] | None=None,
+               exclude_directories: frozenset[str]=_DEFAULT_EXCLUDE_DIRECTORIES) -> list[str]:
+    """
+    List all filenames in a specified directory.
+
+    Symbolic links are not followed and unreadable subdirectories are skipped, see iter_files.
+
+    :param directory_path: str, path to the directory
+    :param include_subdirectories: bool, if True then lists all filenames from subdirectories, defaults to False
+    :param parallel: bool, if True then subdirectories are scanned concurrently, see iter_files, defaults to False
+    :param extensions: tuple of str, only filenames ending with one of these extensions are listed, see iter_files,
+                       defaults to None for all files
+    :param exclude_directories: frozenset of str, names of subdirectories that are skipped entirely,
+                                defaults to frozenset({'__pycache__'})
+    :return: list of str, list of filenames in the specified directory, relative to the directory
+
+    :raises FileNotFoundError: If the directory is not found.
+    """
+
+    file_list_iterator = _scan_file_lists(directory_path, include_subdirectories, parallel, extensions,
+                                          exclude_directories)
+    filename_list = [filename for file_list in file_list_iterator for filename, _ in file_list]
+
+    return filename_list
+
+
+def stat_many(directory_path: str, include_subdirectories: bool=False, extensions: tuple[str, ...] | None=None,
+              exclude_directories: frozenset[str]=_DEFAULT_EXCLUDE_DIRECTORIES) -> list[tuple[str, int, float]]:
+    """
+    Collect the size and last modification time of all files in a specified directory in a single scan.
+
+    Symbolic links are not followed and unreadable subdirectories are skipped, see iter_files.
+
+    :param directory_path: str, path to the directory
+    :param include_subdirectories: bool, if True then includes all files from subdirectories, defaults to False
+    :param extensions: tuple of str, only files ending with one of these extensions are included, see iter_files,
+                       defaults to None for all files
+    :param exclude_directories: frozenset of str, names of subdirectories that are skipped entirely,
+                                defaults to frozenset({'__pycache__'})
+    :return: list of (str, int, float), filename relative to the directory, size of the file in bytes and
+             time the file was last modified in seconds since the epoch
+
+    :raises FileNotFoundError: If the directory is not found.
+    """
+
+    _require_directory(directory_path)
+
+    if include_subdirectories and _HAS_FWALK:
+        file_stat_iterator = _stat_files_fwalk(directory_path, extensions, exclude_directories)
+    else:
+        file_list_iterator = _scan_files(directory_path, include_subdirectories, extensions, exclude_directories)
+        file_stat_iterator = ((filename, entry.stat(follow_symlinks=False))
+                              for file_list in file_list_iterator for filename, entry in file_list)
+
+    file_stat_list = [(filename, file_stat.st_size, file_stat.st_mtime) for filename, file_stat in file_stat_iterator]
+
+    return file_stat_list
+
+
+class FileSystem:
+    """
+    File system operations
+
+    The methods are aliases of the module-level functions, kept for backward compatibility.
+    """
+
+    invalidate_cache = staticmethod(invalidate_cache)
+    is_file = staticmethod(is_file)
+    is_directory = staticmethod(is_directory)
+    is_object = staticmethod(is_object)
+    get_file_size = staticmethod(get_file_size)
+    create_directory = staticmethod(create_directory)
+    remove_directory = staticmethod(remove_directory)
+    get_file_timestamp = staticmethod(get_file_timestamp)
+    is_utf8_encoded = staticmethod(is_utf8_encoded)
+    iter_files = staticmethod(iter_files)
+    list_files = staticmethod(list_files)
+    stat_many = staticmethod(stat_many)
@@ -7,9 +7,20 @@
 from datetime import datetime, timezone
 import os
 import pytest
+import stat
+from tex_parser.file import file_system
 from tex_parser.file.file_system import FileSystem
 
 
+def test_file_system_aliases():
+    """
+    Test that the FileSystem methods are the module-level functions
+    """
+
+    for name in ['invalidate_cache', 'is_file', 'is_directory', 'is_object', 'get_file_size', 'create_directory',
+                 'remove_directory', 'get_file_timestamp', 'is_utf8_encoded', 'iter_files', 'list_files', 'stat_many']:
+        assert getattr(FileSystem, name) is getattr(file_system, name)
+
 def test_is_file(file_test_fixtures_directory):
     """
     Test the is_file method
@@ -46,6 +57,64 @@ def test_is_directory(file_test_fixtures_directory):
     dir_path = 'this_is_not_a_file'
     assert not FileSystem.is_directory(dir_path)
 
+def test_invalidate_cache(tmp_path):
+    """
+    Test the invalidate_cache method and the cached results of is_file and is_directory
+    """
+
+    file_path = str(tmp_path / 'file.tex')
+    directory_path = str(tmp_path / 'directory')
+
+    # test case: results are cached until the cache is invalidated
+    assert not FileSystem.is_file(file_path)
+    with open(file_path, 'w') as file:
+        file.write('text')
+    assert not FileSystem.is_file(file_path)
+    FileSystem.invalidate_cache()
+    assert FileSystem.is_file(file_path)
+
+    # test case: create_directory invalidates the cache
+    assert not FileSystem.is_directory(directory_path)
+    FileSystem.create_directory(directory_path)
+    assert FileSystem.is_directory(directory_path)
+
+    # test case: remove_directory invalidates the cache
+    FileSystem.remove_directory(directory_path)
+    assert not FileSystem.is_directory(directory_path)
+
+    # test case: the other operations do not rely on the cache
+    new_directory_path = str(tmp_path / 'new_directory')
+    new_file_path = os.path.join(new_directory_path, 'new_file.tex')
+    assert not FileSystem.is_directory(new_directory_path)
+    assert not FileSystem.is_file(new_file_path)
+    os.mkdir(new_directory_path)
+    with open(new_file_path, 'w') as file:
+        file.write('text')
+    assert FileSystem.list_files(new_directory_path) == ['new_file.tex']
+    assert [filename for filename, _, _ in FileSystem.stat_many(new_directory_path)] == ['new_file.tex']
+    assert FileSystem.is_utf8_encoded(new_file_path)
+
+def test_cache_relative_paths(tmp_path, monkeypatch):
+    """
+    Test that cached results of is_file and is_directory for relative paths follow the working directory
+    """
+
+    first_directory = tmp_path / 'first'
+    second_directory = tmp_path / 'second'
+    (first_directory / 'sub').mkdir(parents=True)
+    (first_directory / 'x.tex').write_text('text')
+    second_directory.mkdir()
+
+    # test case: relative paths are found in the first working directory
+    monkeypatch.chdir(first_directory)
+    assert FileSystem.is_file('x.tex')
+    assert FileSystem.is_directory('sub')
+
+    # test case: the same relative paths do not exist in the second working directory
+    monkeypatch.chdir(second_directory)
+    assert not FileSystem.is_file('x.tex')
+    assert not FileSystem.is_directory('sub')
+
 def test_get_file_size(file_test_fixtures_directory):
     """
     Test the get_file_size method
@@ -76,46 +145,66 @@ def test_get_file_size_raise_file_not_found(file_test_fixtures_directory):
     with pytest.raises(FileNotFoundError):
         FileSystem.get_file_size(file_path)
 
+    # test case: path continues below a file
+    file_path = os.path.join(file_test_fixtures_directory, 'txt/text_file.txt', 'child')
+    with pytest.raises(FileNotFoundError):
+        FileSystem.get_file_size(file_path)
+
+def test_file_lookup_invalid_paths(tmp_path):
+    """
+    Test that get_file_size, get_file_timestamp and is_utf8_encoded raise FileNotFoundError for paths that cannot be stat'ed
+    """
+
+    symlink_loop_path = tmp_path / 'loop.tex'
+    symlink_loop_path.symlink_to(symlink_loop_path)
+
+    # test cases: symbolic link loop, name longer than the file system allows, name with a null character
+    for file_path in [str(symlink_loop_path), str(tmp_path / ('x' * 1000)), str(tmp_path) + '/null\0.tex']:
+        with pytest.raises(FileNotFoundError):
+            FileSystem.get_file_size(file_path)
+        with pytest.raises(FileNotFoundError):
+            FileSystem.get_file_timestamp(file_path)
+        with pytest.raises(FileNotFoundError):
+            FileSystem.is_utf8_encoded(file_path)
+
 def test_create_directory_success(mocker):
     """
     Test the create_directory method when the method is successful.
     """
 
-    mock_is_object = mocker.patch('tex_parser.file.file_system.FileSystem.is_object', return_value=False)
     mock_makedirs = mocker.patch('os.makedirs')
     directory_path = '/path/to/directory'
 
     FileSystem.create_directory(directory_path)
 
-    mock_is_object.assert_called_once_with(directory_path)
     mock_makedirs.assert_called_once_with(directory_path, exist_ok=False)
 
-def test_create_directory_already_exists(mocker):
+def test_create_directory_already_exists(file_test_fixtures_directory):
     """
     Test the create_directory method when the directory or file object already exists.
     """
 
-    mock_is_object = mocker.patch('tex_parser.file.file_system.FileSystem.is_object', return_value=True)
-    directory_path = '/path/to/directory'
-
+    # test case: directory already exists
+    directory_path = file_test_fixtures_directory
     with pytest.raises(FileExistsError):
         FileSystem.create_directory(directory_path)
 
-    mock_is_object.assert_called_once_with(directory_path)
+    # test case: file already exists
+    file_path = os.path.join(file_test_fixtures_directory, 'txt/text_file.txt')
+    with pytest.raises(FileExistsError):
+        FileSystem.create_directory(file_path)
 
 def test_create_directory_oserror(mocker):
     """
     Test the create_directory method when the directory creation was not successful.
     """
 
-    mock_is_object = mocker.patch('tex_parser.file.file_system.FileSystem.is_object', return_value=False)
     mock_makedirs = mocker.patch('os.makedirs', side_effect=OSError("Error creating directory"))
     directory_path = '/path/to/directory'
 
     with pytest.raises(OSError):
         FileSystem.create_directory(directory_path)
 
-    mock_is_object.assert_called_once_with(directory_path)
     mock_makedirs.assert_called_once_with(directory_path, exist_ok=False)
 
 def test_is_object(file_test_fixtures_directory):
@@ -141,43 +230,64 @@ def test_remove_directory_success(mocker):
     Test the remove_directory method when it is successful.
     """
 
-    mock_is_directory = mocker.patch('tex_parser.file.file_system.FileSystem.is_directory', return_value=True)
     mock_rmtree = mocker.patch('shutil.rmtree')
     directory_path = '/path/to/directory'
 
     FileSystem.remove_directory(directory_path)
 
-    mock_is_directory.assert_called_once_with(directory_path)
     mock_rmtree.assert_called_once_with(directory_path)
 
-def test_remove_directory_not_a_directory(mocker):
+def test_remove_directory_not_a_directory(file_test_fixtures_directory):
     """
     Test the remove_directory method when it is not a directory.
     """
 
-    mock_is_directory = mocker.patch('tex_parser.file.file_system.FileSystem.is_directory', return_value=False)
-    directory_path = '/path/to/directory'
+    # test case: path is a file
+    file_path = os.path.join(file_test_fixtures_directory, 'txt/text_file.txt')
+    with pytest.raises(FileNotFoundError):
+        FileSystem.remove_directory(file_path)
+    assert FileSystem.is_file(file_path)
 
+    # test case: directory not found
+    directory_path = 'this_is_not_a_file'
     with pytest.raises(FileNotFoundError):
         FileSystem.remove_directory(directory_path)
 
-    mock_is_directory.assert_called_once_with(directory_path)
-
-def test_remove_directory_oserror(mocker):
+def test_remove_directory_oserror(tmp_path, mocker):
     """
     Test the remove_directory method when there is an error removing the directory.
     """
 
-    mock_is_directory = mocker.patch('tex_parser.file.file_system.FileSystem.is_directory', return_value=True)
     mock_rmtree = mocker.patch('shutil.rmtree', side_effect=OSError("Error removing directory"))
-    directory_path = '/path/to/directory'
+    directory_path = str(tmp_path)
 
-    with pytest.raises(OSError):
+    with pytest.raises(OSError) as exception_info:
         FileSystem.remove_directory(directory_path)
+    assert not isinstance(exception_info.value, FileNotFoundError)
 
-    mock_is_directory.assert_called_once_with(directory_path)
     mock_rmtree.assert_called_once_with(directory_path)
 
+def test_remove_directory_symbolic_links(tmp_path):
+    """
+    Test the remove_directory method with symbolic links
+    """
+
+    (tmp_path / 'directory').mkdir()
+    (tmp_path / 'file.tex').write_text('text')
+    (tmp_path / 'link_to_file').symlink_to(tmp_path / 'file.tex')
+    (tmp_path / 'link_to_directory').symlink_to(tmp_path / 'directory', target_is_directory=True)
+
+    # test case: symbolic link to a file is not a directory
+    with pytest.raises(FileNotFoundError):
+        FileSystem.remove_directory(str(tmp_path / 'link_to_file'))
+    assert (tmp_path / 'link_to_file').is_symlink()
+
+    # test case: symbolic link to a directory cannot be removed
+    with pytest.raises(OSError) as exception_info:
+        FileSystem.remove_directory(str(tmp_path / 'link_to_directory'))
+    assert not isinstance(exception_info.value, FileNotFoundError)
+    assert (tmp_path / 'directory').is_dir()
+
 def test_get_file_timestamp_mocked(mocker):
     """
     Test the get_file_timestamp method. Mocking is required due to the data file creation times.
@@ -185,11 +295,9 @@ def test_get_file_timestamp_mocked(mocker):
     # Mock the file path
     mock_file_path = "/mock/path/to/file.txt"
 
-    # Mock FileSystem.is_file to return True
-    mock_is_file = mocker.patch("tex_parser.file.file_system.FileSystem.is_file", return_value=True)
-
-    # Mock os.stat to simulate file metadata
+    # Mock os.stat to simulate file metadata of a regular file
     mock_stat_result = mocker.Mock()
+    mock_stat_result.st_mode = stat.S_IFREG | 0o644
     mock_stat_result.st_mtime = 1682000000  # Example timestamp in seconds
     mock_os_stat = mocker.patch("os.stat", return_value=mock_stat_result)
 
@@ -200,9 +308,9 @@ def test_get_file_timestamp_mocked(mocker):
     result = FileSystem.get_file_timestamp(mock_file_path)
 
     # Assertions
-    mock_is_file.assert_called_once_with(mock_file_path)
     mock_os_stat.assert_called_once_with(mock_file_path)
     assert result == expected_timestamp
+    assert result == '2023-04-20T14:13:20+00:00'
 
 def test_get_file_timestamp_raise_file_not_found(file_test_fixtures_directory):
     """
@@ -219,6 +327,11 @@ def test_get_file_timestamp_raise_file_not_found(file_test_fixtures_directory):
     with pytest.raises(FileNotFoundError):
         FileSystem.get_file_timestamp(file_path)
 
+    # test case: path continues below a file
+    file_path = os.path.join(file_test_fixtures_directory, 'txt/text_file.txt', 'child')
+    with pytest.raises(FileNotFoundError):
+        FileSystem.get_file_timestamp(file_path)
+
 def test_is_utf8_encoded(file_test_fixtures_directory):
     """
     Test the is_utf8_encoded method
@@ -234,6 +347,95 @@ def test_is_utf8_encoded(file_test_fixtures_directory):
     is_utf8 = FileSystem.is_utf8_encoded(file_path)
     assert not is_utf8
 
+def test_is_utf8_encoded_chunk_boundaries(tmp_path, mocker):
+    """
+    Test the is_utf8_encoded method when multi-byte sequences cross the chunk boundaries
+    """
+
+    mocker.patch('tex_parser.file.file_system._READ_CHUNK_SIZE', 3)
+
+    # test case: valid multi-byte sequences split across chunks
+    file_path = tmp_path / 'split.tex'
+    file_path.write_bytes('caf\u00e9 na\u00efve \u2211'.encode('utf-8'))
+    assert FileSystem.is_utf8_encoded(str(file_path))
+
+    # test case: multi-byte sequence truncated at the end of the file
+    file_path = tmp_path / 'truncated.tex'
+    file_path.write_bytes(b'abcde\xc3')
+    assert not FileSystem.is_utf8_encoded(str(file_path))
+
+    # test case: incomplete multi-byte sequence followed by an ASCII chunk
+    file_path = tmp_path / 'interrupted.tex'
+    file_path.write_bytes(b'ab\xc3xyz\xa9')
+    assert not FileSystem.is_utf8_encoded(str(file_path))
+
+    # test case: empty file
+    file_path = tmp_path / 'empty.tex'
+    file_path.write_bytes(b'')
+    assert FileSystem.is_utf8_encoded(str(file_path))
+
+def test_is_utf8_encoded_without_mmap(file_test_fixtures_directory, mocker):
+    """
+    Test that the is_utf8_encoded method reads the file without memory-mapping it when no SIMD validator is available
+    """
+
+    mocker.patch('tex_parser.file.file_system._validate_utf8', None)
+    mock_mmap = mocker.patch('mmap.mmap', side_effect=OSError(19, 'No such device'))
+
+    # test case: file is UTF-8 encoded
+    file_path = os.path.join(file_test_fixtures_directory, 'txt/text_file.txt')
+    assert FileSystem.is_utf8_encoded(file_path)
+
+    # test case: file is not UTF-8 encoded
+    file_path = os.path.join(file_test_fixtures_directory, 'txt/non_utf8_sample.txt')
+    assert not FileSystem.is_utf8_encoded(file_path)
+
+    mock_mmap.assert_not_called()
+
+def test_is_utf8_encoded_simd_validator(tmp_path, mocker):
+    """
+    Test the is_utf8_encoded method when the optional SIMD validator is available
+    """
+
+    validated_data = []
+    def validate_utf8(buffer):
+        validated_data.append(bytes(buffer))
+        return False
+
+    mock_validate = mocker.patch('tex_parser.file.file_system._validate_utf8', side_effect=validate_utf8)
+
+    # test case: the validator is given the file contents and its result is returned
+    file_path = tmp_path / 'sample.tex'
+    file_path.write_bytes(b'\\section{Intro}')
+    assert not FileSystem.is_utf8_encoded(str(file_path))
+    assert validated_data == [b'\\section{Intro}']
+
+    # test case: empty file cannot be memory-mapped, the contents are read instead
+    mock_validate.reset_mock()
+    file_path = tmp_path / 'empty.tex'
+    file_path.write_bytes(b'')
+    assert FileSystem.is_utf8_encoded(str(file_path))
+    mock_validate.assert_not_called()
+
+def test_is_utf8_encoded_simd_validator_mmap_fallback(file_test_fixtures_directory, mocker):
+    """
+    Test the is_utf8_encoded method when the optional SIMD validator is available but the file cannot be memory-mapped
+    """
+
+    mock_validate = mocker.patch('tex_parser.file.file_system._validate_utf8', return_value=True)
+
+    # test cases: error raised by mmap, such as an unsupported file system or a file reporting a size of 0
+    for mmap_error in [OSError(19, 'No such device'), ValueError('cannot mmap an empty file')]:
+        mocker.patch('mmap.mmap', side_effect=mmap_error)
+
+        file_path = os.path.join(file_test_fixtures_directory, 'txt/text_file.txt')
+        assert FileSystem.is_utf8_encoded(file_path)
+
+        file_path = os.path.join(file_test_fixtures_directory, 'txt/non_utf8_sample.txt')
+        assert not FileSystem.is_utf8_encoded(file_path)
+
+    mock_validate.assert_not_called()
+
 def test_is_utf8_encoded_raise_file_not_found(file_test_fixtures_directory):
     """
     Test the is_utf8_encoded method when the file is not found or the path directs to a non-file
@@ -284,6 +486,74 @@ def test_list_files(file_test_fixtures_directory):
     filtered_filename_list = [fn for fn in filename_list if '__pycache__' not in fn and '.DS_Store' not in fn]
     assert set(expected_filenames) == set(filtered_filename_list)
 
+def test_list_files_filters(tmp_path):
+    """
+    Test the list_files, iter_files and stat_many methods with extension and directory filters
+    """
+
+    for relative_path in ['main.tex', 'refs.bib', 'notes.txt', 'chapters/intro.tex', 'chapters.tex/body.txt',
+                          '__pycache__/cached.tex', 'build/output.tex']:
+        file_path = tmp_path / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text('text')
+    dir_path = str(tmp_path)
+
+    # test case: __pycache__ is excluded by default
+    filename_list = FileSystem.list_files(dir_path, include_subdirectories=True)
+    assert os.path.join('__pycache__', 'cached.tex') not in filename_list
+    assert len(filename_list) == 6
+
+    # test case: extensions only apply to files, directories are still descended into
+    expected_filenames = {'main.tex', 'refs.bib', os.path.join('chapters', 'intro.tex'), os.path.join('build', 'output.tex')}
+    filename_list = FileSystem.list_files(dir_path, include_subdirectories=True, extensions=('.tex', '.bib'))
+    assert set(filename_list) == expected_filenames
+    filename_list = FileSystem.list_files(dir_path, include_subdirectories=True, parallel=True, extensions=('.tex', '.bib'))
+    assert set(filename_list) == expected_filenames
+    assert set(FileSystem.list_files(dir_path, extensions=('.tex',))) == {'main.tex'}
+
+    # test case: custom excluded directories
+    expected_filenames = {'main.tex', os.path.join('chapters', 'intro.tex'), os.path.join('__pycache__', 'cached.tex')}
+    filename_iterator = FileSystem.iter_files(dir_path, include_subdirectories=True, extensions=('.tex',),
+                                              exclude_directories=frozenset({'build'}))
+    assert set(filename_iterator) == expected_filenames
+
+    # test case: stat_many applies the same filters
+    file_stat_list = FileSystem.stat_many(dir_path, include_subdirectories=True, extensions=('.tex',),
+                                          exclude_directories=frozenset({'build', '__pycache__'}))
+    assert {filename for filename, _, _ in file_stat_list} == {'main.tex', os.path.join('chapters', 'intro.tex')}
+
+def test_list_files_unreadable_subdirectories(tmp_path, mocker):
+    """
+    Test the list_files method when subdirectories cannot be read or are removed during the scan
+    """
+
+    for relative_path in ['a.tex', 'ok/b.tex', 'locked/c.tex', 'removed/d.tex']:
+        file_path = tmp_path / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text('text')
+    dir_path = str(tmp_path)
+
+    scandir = os.scandir
+    scan_errors = {os.path.join(dir_path, 'locked'): PermissionError(13, 'Permission denied'),
+                   os.path.join(dir_path, 'removed'): FileNotFoundError(2, 'No such file or directory')}
+    def failing_scandir(path):
+        if path in scan_errors:
+            raise scan_errors[path]
+        return scandir(path)
+    mocker.patch('os.scandir', side_effect=failing_scandir)
+
+    # test case: the subdirectories are skipped, serial and parallel
+    expected_filenames = {'a.tex', os.path.join('ok', 'b.tex')}
+    assert set(FileSystem.list_files(dir_path, include_subdirectories=True)) == expected_filenames
+    assert set(FileSystem.list_files(dir_path, include_subdirectories=True, parallel=True)) == expected_filenames
+
+    # test case: errors for the top-level directory are raised
+    scan_errors[dir_path] = PermissionError(13, 'Permission denied')
+    with pytest.raises(PermissionError):
+        FileSystem.list_files(dir_path, include_subdirectories=True)
+    with pytest.raises(PermissionError):
+        FileSystem.list_files(dir_path, include_subdirectories=True, parallel=True)
+
 def test_list_files_raise_directory_not_found(file_test_fixtures_directory):
     """
     Test the list_files method when the directory is not found
@@ -321,3 +591,182 @@ def test_list_files_raise_directory_not_found(file_test_fixtures_directory):
     dir_path = 'this_is_not_a_file'
     with pytest.raises(FileNotFoundError):
         FileSystem.list_files(dir_path, include_subdirectories=True)
+
+def test_list_files_symbolic_links(tmp_path):
+    """
+    Test the list_files and stat_many methods with symbolic links
+    """
+
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'file.tex').write_text('text')
+    (tmp_path / 'link_to_sub').symlink_to(tmp_path / 'sub', target_is_directory=True)
+    (tmp_path / 'link_to_file.tex').symlink_to(tmp_path / 'sub' / 'file.tex')
+    (tmp_path / 'broken_link').symlink_to(tmp_path / 'missing')
+
+    # test case: symbolic links are not followed, neither to directories nor to files
+    filename_list = FileSystem.list_files(str(tmp_path), include_subdirectories=True)
+    assert filename_list == [os.path.join('sub', 'file.tex')]
+    file_stat_list = FileSystem.stat_many(str(tmp_path), include_subdirectories=True)
+    assert [filename for filename, _, _ in file_stat_list] == [os.path.join('sub', 'file.tex')]
+
+    # test case: top level only
+    filename_list = FileSystem.list_files(str(tmp_path))
+    assert filename_list == []
+
+def test_iter_files(file_test_fixtures_directory):
+    """
+    Test the iter_files method
+    """
+
+    dir_path = file_test_fixtures_directory
+
+    # test case: the result is an iterator that matches list_files
+    filename_iterator = FileSystem.iter_files(dir_path, include_subdirectories=True)
+    assert iter(filename_iterator) is filename_iterator
+    assert set(filename_iterator) == set(FileSystem.list_files(dir_path, include_subdirectories=True))
+
+    # test case: top level only
+    assert set(FileSystem.iter_files(dir_path)) == set(FileSystem.list_files(dir_path))
+
+def test_iter_files_parallel(file_test_fixtures_directory, tmp_path):
+    """
+    Test the iter_files and list_files methods when subdirectories are scanned in parallel
+    """
+
+    dir_path = file_test_fixtures_directory
+
+    # test case: same filenames as the serial scan
+    expected_filenames = set(FileSystem.list_files(dir_path, include_subdirectories=True))
+    assert set(FileSystem.iter_files(dir_path, include_subdirectories=True, parallel=True)) == expected_filenames
+    assert set(FileSystem.list_files(dir_path, include_subdirectories=True, parallel=True)) == expected_filenames
+
+    # test case: parallel has no effect without subdirectories
+    assert set(FileSystem.list_files(dir_path, parallel=True)) == set(FileSystem.list_files(dir_path))
+
+    # test case: nested directories, stopping the iteration early
+    for index in range(20):
+        nested_path = tmp_path / f'a{index}' / 'b' / 'c'
+        nested_path.mkdir(parents=True)
+        (nested_path / 'file.tex').write_text('text')
+    filename_iterator = FileSystem.iter_files(str(tmp_path), include_subdirectories=True, parallel=True)
+    assert next(filename_iterator).endswith('file.tex')
+    filename_iterator.close()
+    assert len(FileSystem.list_files(str(tmp_path), include_subdirectories=True, parallel=True)) == 20
+
+def test_iter_files_raise_directory_not_found():
+    """
+    Test the iter_files method when the directory is not found, the error is raised before iterating
+    """
+
+    dir_path = 'this_is_not_a_file'
+    with pytest.raises(FileNotFoundError):
+        FileSystem.iter_files(dir_path)
+
+def test_stat_many(file_test_fixtures_directory):
+    """
+    Test the stat_many method
+    """
+
+    dir_path = file_test_fixtures_directory
+
+    # test case: top level only
+    file_stat_list = FileSystem.stat_many(dir_path)
+    assert {filename for filename, _, _ in file_stat_list} == set(FileSystem.list_files(dir_path))
+
+    # test case: subdirectories, sizes and timestamps agree with os.stat
+    file_stat_list = FileSystem.stat_many(dir_path, include_subdirectories=True)
+    assert {filename for filename, _, _ in file_stat_list} == set(FileSystem.list_files(dir_path, include_subdirectories=True))
+    for filename, file_size, last_modified in file_stat_list:
+        file_stat = os.stat(os.path.join(dir_path, filename))
+        assert file_size == file_stat.st_size
+        assert last_modified == file_stat.st_mtime
+    assert (os.path.join('txt', 'text_file.txt'), 9) in [(filename, file_size) for filename, file_size, _ in file_stat_list]
+
+    # test case: directory path with a trailing separator
+    assert sorted(FileSystem.stat_many(dir_path + os.sep, include_subdirectories=True)) == sorted(file_stat_list)
+
+def test_stat_many_without_fwalk(file_test_fixtures_directory, tmp_path, mocker):
+    """
+    Test the stat_many method when os.fwalk is not available
+    """
+
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'file.tex').write_text('text')
+    (tmp_path / 'sub' / 'notes.txt').write_text('notes')
+    (tmp_path / 'link.tex').symlink_to(tmp_path / 'sub' / 'file.tex')
+    (tmp_path / 'sub' / 'nested').mkdir()
+    (tmp_path / 'sub' / 'nested' / 'deep.tex').write_text('deep')
+    (tmp_path / 'root_link').symlink_to(tmp_path / 'sub', target_is_directory=True)
+    dir_path_list = [file_test_fixtures_directory, str(tmp_path), str(tmp_path / 'root_link')]
+
+    expected_stat_lists = [sorted(FileSystem.stat_many(dir_path, include_subdirectories=True, extensions=extensions))
+                           for dir_path in dir_path_list
+                           for extensions in [None, ('.tex',)]]
+
+    mocker.patch('tex_parser.file.file_system._HAS_FWALK', False)
+    stat_lists = [sorted(FileSystem.stat_many(dir_path, include_subdirectories=True, extensions=extensions))
+                  for dir_path in dir_path_list
+                  for extensions in [None, ('.tex',)]]
+
+    assert stat_lists == expected_stat_lists
+    assert [filename for filename, _, _ in stat_lists[3]] == [os.path.join('sub', 'file.tex'),
+                                                              os.path.join('sub', 'nested', 'deep.tex')]
+
+    # test case: the top-level directory is a symbolic link to a directory
+    assert [filename for filename, _, _ in stat_lists[4]] == ['file.tex', os.path.join('nested', 'deep.tex'), 'notes.txt']
+
+def test_stat_many_unreadable_subdirectories(tmp_path, mocker):
+    """
+    Test the stat_many method when subdirectories cannot be read, with and without os.fwalk
+    """
+
+    for relative_path in ['a.tex', 'ok/b.tex', 'locked/c.tex', 'removed/d.tex']:
+        file_path = tmp_path / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text('text')
+    dir_path = str(tmp_path)
+
+    # os.fwalk opens subdirectories by name relative to their parent, the scandir scan uses full paths
+    scan_errors = {'locked': PermissionError(13, 'Permission denied'),
+                   'removed': FileNotFoundError(2, 'No such file or directory')}
+    scandir = os.scandir
+    os_open = os.open
+    def failing_scandir(path):
+        if isinstance(path, str) and os.path.basename(path) in scan_errors:
+            raise scan_errors[os.path.basename(path)]
+        return scandir(path)
+    def failing_open(path, *args, **kwargs):
+        if os.path.basename(os.path.normpath(path)) in scan_errors:
+            raise scan_errors[os.path.basename(os.path.normpath(path))]
+        return os_open(path, *args, **kwargs)
+    mocker.patch('os.scandir', side_effect=failing_scandir)
+    mocker.patch('os.open', side_effect=failing_open)
+
+    expected_filenames = ['a.tex', os.path.join('ok', 'b.tex')]
+    for has_fwalk in [True, False]:
+        mocker.patch('tex_parser.file.file_system._HAS_FWALK', has_fwalk)
+
+        # test case: the subdirectories are skipped
+        file_stat_list = FileSystem.stat_many(dir_path, include_subdirectories=True)
+        assert sorted(filename for filename, _, _ in file_stat_list) == expected_filenames
+
+        # test case: errors for the top-level directory are raised
+        scan_errors[os.path.basename(dir_path)] = PermissionError(13, 'Permission denied')
+        with pytest.raises(PermissionError):
+            FileSystem.stat_many(dir_path, include_subdirectories=True)
+        del scan_errors[os.path.basename(dir_path)]
+
+def test_stat_many_raise_directory_not_found(file_test_fixtures_directory):
+    """
+    Test the stat_many method when the directory is not found
+    """
+
+    # test case: path is a file
+    file_path = os.path.join(file_test_fixtures_directory, 'txt/text_file.txt')
+    with pytest.raises(FileNotFoundError):
+        FileSystem.stat_many(file_path)
+
+    # test case: directory not found
+    dir_path = 'this_is_not_a_file'
+    with pytest.raises(FileNotFoundError):
+        FileSystem.stat_many(dir_path, include_subdirectories=True)